@@ -21,11 +21,15 @@ import json
 import re
 
 from datetime import datetime
-from time import mktime
 
 from flask import Response
 from flask.wrappers import Request
 
+from ..utils.dates import to_timestamp
+
+CAMEL_CASE_KEYS = {}
+CAMEL_CASE_KEYS_SIZE = 4096
+
 
 class CustomResponse(Response):  # pylint: disable=too-many-ancestors
     """
@@ -50,35 +54,30 @@ class CustomResponse(Response):  # pylint: disable=too-many-ancestors
             :returns: the converted obj
         """
         if isinstance(obj, dict):
-            new_dict = {}
-
-            for key, value in obj.iteritems():
-                if isinstance(value, dict):
-                    value = cls._format_response(value)
-
-                elif isinstance(value, list):
-                    value = [cls._format_response(i) for i in value]
-
-                elif isinstance(value, datetime):
-                    value = int(mktime(value.timetuple()))
-
-                new_key_name = cls._to_camel_case(key)
-                new_dict[new_key_name] = value
-
-            return new_dict
+            return {
+                cls._to_camel_case(key): cls._format_response(value)
+                for key, value in obj.iteritems()
+            }
 
         if isinstance(obj, list):
             return [cls._format_response(i) for i in obj]
 
         if isinstance(obj, datetime):
-            return int(mktime(obj.timetuple()))
+            return int(to_timestamp(obj))
 
         return obj
 
     @classmethod
     def _to_camel_case(cls, string):
         """Give the camelCase representation of a snake_case string."""
-        return re.sub(r"_(\w)", lambda x: x.group(1).upper(), string)
+        try:
+            return CAMEL_CASE_KEYS[string]
+        except KeyError:
+            camel = re.sub(r"_(\w)", lambda x: x.group(1).upper(), string)
+            if len(CAMEL_CASE_KEYS) >= CAMEL_CASE_KEYS_SIZE:
+                CAMEL_CASE_KEYS.clear()
+            CAMEL_CASE_KEYS[string] = camel
+            return camel
 
 
 class ExtendedRequest(Request):
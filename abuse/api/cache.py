@@ -1,14 +1,30 @@
 
 from functools import wraps
-
-from json import dumps
+from hashlib import md5
 
 from flask import g, request
+from six import integer_types
+from six.moves import cPickle as pickle
 from werkzeug.contrib.cache import RedisCache
+from werkzeug.urls import url_encode
 
 from ..models import Role
 
 
+class PickleRedisCache(RedisCache):
+    """
+        `RedisCache` serializing with the highest pickle protocol
+    """
+
+    def dump_object(self, value):
+        """
+            Same as `RedisCache.dump_object` but with a binary pickle protocol
+        """
+        if type(value) in integer_types:
+            return str(value).encode("ascii")
+        return b"!" + pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+
 class Cache(object):
 
     instance = None
@@ -19,12 +35,37 @@ class Cache(object):
         """
             Set up Cache
         """
-        cls.instance = RedisCache(
+        cls.instance = PickleRedisCache(
             host=config["REDIS"]["host"],
             port=config["REDIS"]["port"],
             password=config["REDIS"]["password"],
         )
 
+    @staticmethod
+    def make_key(path, query, user):
+        """
+            Build a deterministic cache key for given route
+
+            :param str path: The request path
+            :param str query: The request args, see `Cache.encode_args`
+            :param user: The `abuse.models.User` id or None
+            :rtype: str
+            :return: The hex digest of the route
+        """
+        route = u"%s?%s,%s" % (path, query, user)
+        return md5(route.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def encode_args(args):
+        """
+            Serialize request args in a stable order
+
+            :param dict args: The request args (`dict` or `MultiDict`)
+            :rtype: str
+            :return: The sorted url-encoded args
+        """
+        return url_encode(args, sort=True)
+
     @classmethod
     def cached(cls, timeout=None, current_user=False):
         """
@@ -35,11 +76,12 @@ class Cache(object):
             @wraps(func)
             def decorated_func(*args, **kwargs):
                 user = g.user.id if current_user else None
-                route = "%s,%s,%s" % (request.path, dumps(request.args), user)
-                response = cls.instance.get(unicode(route))
+                query = cls.encode_args(request.args)
+                key = cls.make_key(request.path, query, user)
+                response = cls.instance.get(key)
                 if response is None:
                     response = func(*args, **kwargs)
-                    cls.instance.set(route, response, timeout or cls.timeout)
+                    cls.instance.set(key, response, timeout or cls.timeout)
                 return response
 
             return decorated_func
@@ -51,19 +93,19 @@ class Cache(object):
         """
             Invalidate cache for given routes
         """
-        args = args or {}
+        query = cls.encode_args(args or {})
+        keys = [cls.make_key(path, query, None) for path in routes]
 
         def decorator(func):
             @wraps(func)
             def decorated_func(*fargs, **fkwargs):
                 response = func(*fargs, **fkwargs)
-                for path in routes:
-                    route = "%s,%s,%s" % (path, dumps(args), None)
-                    cls.instance.delete(unicode(route))
-                    user = fkwargs.get("user", None) if clear_for_user else None
-                    if user:
-                        route = "%s,%s,%s" % (path, dumps(args), user)
-                        cls.instance.delete(unicode(route))
+                user = fkwargs.get("user", None) if clear_for_user else None
+                if user:
+                    user_keys = [cls.make_key(path, query, user) for path in routes]
+                    cls.instance.delete_many(*(keys + user_keys))
+                else:
+                    cls.instance.delete_many(*keys)
                 return response
 
             return decorated_func
@@ -23,13 +23,13 @@
 """
 
 from functools import wraps
-from time import mktime
 
 from django.db.models import ObjectDoesNotExist
 from django.forms.models import model_to_dict
 from werkzeug.exceptions import BadRequest, Forbidden, NotFound
 
 from ...models import Comment, DefendantComment, Ticket, History, TicketComment, User
+from ...utils.dates import to_timestamp
 
 
 def check_comment(func):
@@ -75,7 +75,7 @@ def show(comment_id):
         raise NotFound("Comment not found")
 
     comment_dict = model_to_dict(comment)
-    comment_dict["date"] = mktime(comment.date.timetuple())
+    comment_dict["date"] = to_timestamp(comment.date)
 
     if comment_dict.get("user"):
         comment_dict["user"] = User.objects.get(id=comment_dict["user"]).username
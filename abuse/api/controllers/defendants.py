@@ -22,13 +22,11 @@
     Cerberus defendant manager
 """
 
-from collections import Counter
-from time import mktime
-
 from django.core.exceptions import FieldError
 from django.db import IntegrityError
-from django.db.models import ObjectDoesNotExist, Q
+from django.db.models import Count, ObjectDoesNotExist, Q
 from django.forms.models import model_to_dict
+from redis.exceptions import RedisError
 from werkzeug.exceptions import BadRequest, InternalServerError, NotFound
 
 from ...models import (
@@ -44,37 +42,63 @@ from ...models import (
 from ...services.helpers import InvalidFormatError, SchemaNotFound
 from ...services.crm import CRMService, CRMServiceException
 from ...tasks import enqueue
+from ...utils.cache import RedisHandler
+from ...utils.dates import to_timestamp
+
+DefendantTag = Defendant.tags.through
+
+DEFENDANT_FIELDS = Defendant.get_fields()
+
+# Skip details id, else override defendant id with details id ....
+DETAILS_FIELDS = {
+    "details__" + field: field
+    for field in DefendantRevision.get_fields()
+    if field != "id"
+}
+
+DEFENDANT_REFRESH_KEY = "cerberus:defendant:refresh:{}"
+DEFENDANT_REFRESH_INTERVAL = 300
 
 
 def show(defendant_id):
     """
         Get defendant
     """
+    # Flat details
     try:
-        defendant = Defendant.get(id=defendant_id)
-    except (ObjectDoesNotExist, ValueError):
+        defendant = Defendant.filter(id=defendant_id).values(
+            *(DEFENDANT_FIELDS + list(DETAILS_FIELDS))
+        )[0]
+    except (IndexError, ValueError):
         raise NotFound("Defendant not found")
 
-    # BTW, refresh defendant infos
-    enqueue("defendant.refresh_defendant_infos", defendant_id=defendant.id)
+    defendant_dict = {DETAILS_FIELDS.get(k, k): v for k, v in defendant.iteritems()}
 
-    # Flat details
-    defendant_dict = model_to_dict(defendant)
-    details = model_to_dict(defendant.details)
-    details.pop("id")  # Else override defendant id with details id ....
-    defendant_dict.update(details)
+    # BTW, refresh defendant infos (at most every DEFENDANT_REFRESH_INTERVAL)
+    refresh_key = DEFENDANT_REFRESH_KEY.format(defendant_dict["id"])
+    try:
+        refresh = RedisHandler.setnx(refresh_key, True, DEFENDANT_REFRESH_INTERVAL)
+    except RedisError:
+        refresh = True
+    if refresh:
+        enqueue("defendant.refresh_defendant_infos", defendant_id=defendant_dict["id"])
 
     # Add comments
+    comments = (
+        DefendantComment.filter(defendant=defendant_dict["id"])
+        .order_by("-comment__date")
+        .values_list(
+            "comment__id", "comment__user__username", "comment__date", "comment__comment"
+        )
+    )
     defendant_dict["comments"] = [
         {
-            "id": c.comment.id,
-            "user": c.comment.user.username,
-            "date": mktime(c.comment.date.timetuple()),
-            "comment": c.comment.comment,
+            "id": comment_id,
+            "user": username,
+            "date": to_timestamp(date),
+            "comment": comment,
         }
-        for c in DefendantComment.filter(defendant=defendant.id).order_by(
-            "-comment__date"
-        )
+        for comment_id, username, date, comment in comments
     ]
 
     if defendant_dict.get("creationDate", None):
@@ -83,7 +107,7 @@ def show(defendant_id):
         )
 
     # Add tags
-    tags = Defendant.get(id=defendant.id).tags.all()
+    tags = Tag.filter(defendant=defendant_dict["id"])
     defendant_dict["tags"] = [model_to_dict(tag) for tag in tags]
 
     return defendant_dict
@@ -99,14 +123,23 @@ def add_tag(defendant_id, body, user):
         if defendant.__class__.__name__ != tag.tagType:
             raise BadRequest("Invalid tag for defendant")
 
-        for defendt in Defendant.filter(customerId=defendant.customerId):
+        defendants = Defendant.filter(customerId=defendant.customerId).exclude(
+            tags=tag
+        )
+        DefendantTag.objects.bulk_create(
+            [
+                DefendantTag(defendant_id=defendt_id, tag_id=tag.id)
+                for defendt_id in defendants.values_list("id", flat=True)
+            ]
+        )
 
-            defendt.tags.add(tag)
-            defendt.save()
-            for ticket in defendt.ticketDefendant.all():
-                History.log_ticket_action(
-                    ticket=ticket, action="add_tag", user=user, tag_name=tag.name
-                )
+        tickets = Ticket.filter(defendant__customerId=defendant.customerId)
+        History.log_tickets_action(
+            tickets=tickets.only("id", "status"),
+            action="add_tag",
+            user=user,
+            tag_name=tag.name,
+        )
 
     except (KeyError, FieldError, IntegrityError, ObjectDoesNotExist, ValueError):
         raise NotFound("Defendant or tag not found")
@@ -121,14 +154,17 @@ def remove_tag(defendant_id, tag_id, user):
         tag = Tag.get(id=tag_id)
         defendant = Defendant.get(id=defendant_id)
 
-        for defendt in Defendant.filter(customerId=defendant.customerId):
-            defendt.tags.remove(tag)
-            defendt.save()
+        DefendantTag.objects.filter(
+            defendant__customerId=defendant.customerId, tag=tag
+        ).delete()
 
-            for ticket in defendt.ticketDefendant.all():
-                History.log_ticket_action(
-                    ticket=ticket, action="remove_tag", user=user, tag_name=tag.name
-                )
+        tickets = Ticket.filter(defendant__customerId=defendant.customerId)
+        History.log_tickets_action(
+            tickets=tickets.only("id", "status"),
+            action="remove_tag",
+            user=user,
+            tag_name=tag.name,
+        )
 
     except (ObjectDoesNotExist, FieldError, IntegrityError, ValueError):
         raise NotFound("Defendant or tag not found")
@@ -164,20 +200,29 @@ def get_or_create(customer_id=None):
 def get_defendant_top20():
     """ Get top 20 defendant with open tickets/reports
     """
-    ticket = Ticket.filter(~Q(defendant=None), ~Q(status="Closed")).values_list(
-        "defendant__id", flat=True
+    ticket = list(
+        Ticket.filter(~Q(defendant=None), ~Q(status="Closed"))
+        .values_list("defendant")
+        .annotate(count=Count("id"))
+        .order_by("-count", "defendant")[:20]
     )
-    ticket = Counter(ticket).most_common(20)
 
-    report = Report.filter(~Q(defendant=None), ~Q(status="Archived")).values_list(
-        "defendant__id", flat=True
+    report = list(
+        Report.filter(~Q(defendant=None), ~Q(status="Archived"))
+        .values_list("defendant")
+        .annotate(count=Count("id"))
+        .order_by("-count", "defendant")[:20]
     )
-    report = Counter(report).most_common(20)
+
+    ids = [d for d, _ in ticket] + [d for d, _ in report]
+    defendants = {
+        d.id: d for d in Defendant.filter(id__in=ids).select_related("details")
+    }
 
     res = {"report": [], "ticket": []}
-    for kind in res:
-        for defendant_id, count in locals()[kind]:
-            defendant = Defendant.get(id=defendant_id)
+    for kind, items in (("report", report), ("ticket", ticket)):
+        for defendant_id, count in items:
+            defendant = defendants[defendant_id]
             res[kind].append(
                 {
                     "id": defendant.id,
@@ -29,7 +29,6 @@ import re
 from base64 import b64encode
 from copy import deepcopy
 from datetime import datetime, timedelta
-from time import mktime
 from urllib import unquote
 
 import jwt
@@ -72,6 +71,7 @@ from ...models import (
 from ...tasks import enqueue
 from ...utils import cache
 from ...utils.crypto import CryptoException, CryptoHandler
+from ...utils.dates import to_timestamp
 
 
 def auth(body):
@@ -181,10 +181,13 @@ def check_perms(**kwargs):
         except ValueError:
             raise BadRequest("Ticket ID is integer")
 
-    perm_count = AbusePermission.filter(
-        user=user.id, profile__name__in=GENERAL_CHECK_PERM_DEFENDANT_LEVEL
-    ).count()
-    if "defendant" in kwargs and kwargs["method"] != "GET" and not perm_count:
+    if (
+        "defendant" in kwargs
+        and kwargs["method"] != "GET"
+        and not AbusePermission.filter(
+            user=user.id, profile__name__in=GENERAL_CHECK_PERM_DEFENDANT_LEVEL
+        ).exists()
+    ):
         raise Forbidden("Forbidden")
 
     return {"message": "OK"}
@@ -249,16 +252,12 @@ def update_user(user_id, body):
         raise BadRequest("Invalid category or profile")
 
     # Unassigned tickets no more allowed
-    cats = (
-        AbusePermission.filter(user=user).values_list("category", flat=True).distinct()
+    cats = AbusePermission.filter(user=user).values_list("category", flat=True)
+    tickets = Ticket.filter(treatedBy=user).exclude(category__in=cats)
+    History.log_tickets_action(
+        tickets=tickets, action="change_treatedby", new_value=user.username
     )
-    for ticket in Ticket.filter(treatedBy=user):
-        if ticket.category_id not in cats:
-            History.log_ticket_action(
-                ticket=ticket, action="change_treatedby", new_value=user.username
-            )
-            ticket.treatedBy = None
-            ticket.save()
+    tickets.update(treatedBy=None, modificationDate=datetime.now())
     body.pop("profiles", None)
 
     try:
@@ -334,7 +333,7 @@ def update_ticket_resolution(resolution_id, body):
     try:
         resolution = Resolution.get(id=int(resolution_id))
         codename = body["codename"]
-        if Resolution.filter(codename=codename).count():
+        if Resolution.filter(codename=codename).exists():
             raise BadRequest("Ticket resolution already exists")
         resolution.codename = codename
         resolution.save()
@@ -350,7 +349,7 @@ def delete_ticket_resolution(resolution_id):
     """
     try:
         resolution = Resolution.get(id=int(resolution_id))
-        if resolution.ticket_set.count():
+        if resolution.ticket_set.exists():
             raise BadRequest("This resolution is linked to at least one ticket")
     except ValueError:
         raise BadRequest("Expecting id, not string")
@@ -440,7 +439,7 @@ def _get_enhanced_search_filters(filters):
                     elif "ticketTag" in field:
                         if Tag.filter(
                             name__in=field["ticketTag"], tagType="Report"
-                        ).count():
+                        ).exists():
                             new_where[key].append({"reportsTag": field["ticketTag"]})
                         else:
                             new_where[key].append({"ticketsTag": field["ticketTag"]})
@@ -456,7 +455,7 @@ def toolbar(**kwargs):
     user = kwargs["user"]
     where = [Q()]
 
-    if not AbusePermission.filter(user=user.id).count():
+    if not AbusePermission.filter(user=user.id).exists():
         raise Forbidden("You are not allowed to see any category")
 
     user_specific_where = _get_user_specific_where(user)
@@ -538,37 +537,28 @@ def dashboard(**kwargs):
     """ Get dashboard stats
     """
     user = kwargs["user"]
-    categories = (
+    categories = list(
         AbusePermission.filter(user=user.id)
         .values_list("category", flat=True)
         .distinct()
         .order_by("category")
     )
 
-    where = [Q(category=cat) for cat in categories]
-
-    if not len(where):
+    if not categories:
         raise Forbidden("You are not allowed to see any category")
 
-    where = reduce(operator.or_, where)
+    reports = Report.filter(category__in=categories).exclude(status="Archived")
 
     resp = {}
-    res = (
-        Report.filter(where, ~Q(status="Archived"))
-        .values("category")
-        .annotate(count=Count("category"))
-    )
+    res = reports.values("category").annotate(count=Count("category"))
     resp["reportsByCategory"] = {k["category"]: k["count"] for k in res}
 
-    res = (
-        Report.filter(where, ~Q(status="Archived"))
-        .values("status")
-        .annotate(count=Count("status"))
-    )
+    res = reports.values("status").annotate(count=Count("status"))
     resp["reportsByStatus"] = {k["status"]: k["count"] for k in res}
 
     res = (
-        Ticket.filter(where, ~Q(status="Closed"))
+        Ticket.filter(category__in=categories)
+        .exclude(status="Closed")
         .values("status")
         .annotate(count=Count("status"))
     )
@@ -587,7 +577,7 @@ def dashboard(**kwargs):
             {name: [req[c] if c in req else 0 for c in categories]}
         )
 
-    resp["categories"] = list(categories)
+    resp["categories"] = categories
     return resp
 
 
@@ -648,7 +638,7 @@ def get_mass_contact(filters=None):
                     "category": campaign.category.name,
                     "user": campaign.user.username,
                     "ipsCount": campaign.ipsCount,
-                    "date": int(mktime(campaign.date.timetuple())),
+                    "date": int(to_timestamp(campaign.date)),
                     "result": model_to_dict(campaign.masscontactresult_set.all()[0]),
                 }
             )
@@ -22,7 +22,6 @@
 """
 
 import json
-import time
 from urllib import unquote
 
 from django.contrib.auth.models import User
@@ -33,6 +32,7 @@ from django.forms.models import model_to_dict
 from werkzeug.exceptions import BadRequest, Forbidden, NotFound
 
 from ...models import News
+from ...utils.dates import to_timestamp
 
 
 def get_news(**kwargs):
@@ -73,7 +73,7 @@ def get_news(**kwargs):
         if news.get("author", None):
             news["author"] = User.objects.get(id=news["author"]).username
         if news.get("date", None):
-            news["date"] = time.mktime(news["date"].timetuple())
+            news["date"] = to_timestamp(news["date"])
 
     resp = {"news": list(news_list)}
     resp["newsCount"] = nb_record_filtered
@@ -89,7 +89,7 @@ def show(news_id):
         if news.get("author", None):
             news["author"] = User.objects.get(id=news["author"]).username
         if news.get("date", None):
-            news["date"] = time.mktime(news["date"].timetuple())
+            news["date"] = to_timestamp(news["date"])
     except (IndexError, ValueError):
         return BadRequest("Not a valid news id")
     except ObjectDoesNotExist:
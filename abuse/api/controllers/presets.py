@@ -183,7 +183,7 @@ def create(body):
         body["codename"] = body["name"].strip().lower().replace(" ", "_")
         existing = TicketWorkflowPreset.filter(
             codename=body["codename"], name=body["name"]
-        ).count()
+        ).exists()
         if existing:
             transaction.rollback()
             raise BadRequest("Preset with same codename/name exists")
@@ -228,7 +228,7 @@ def update(user, preset_id, body):
     except (ObjectDoesNotExist, ValueError):
         raise NotFound("Preset not found")
 
-    if TicketWorkflowPreset.filter(~Q(id=preset_id), name=body["name"]).count():
+    if TicketWorkflowPreset.filter(~Q(id=preset_id), name=body["name"]).exists():
         raise BadRequest("Preset with same name already exists")
 
     if body.get("action"):
@@ -216,7 +216,6 @@ def add_tag(provider_email, body):
             raise BadRequest("Invalid tag for provider")
 
         provider.tags.add(tag)
-        provider.save()
 
     except (KeyError, FieldError, IntegrityError, ObjectDoesNotExist, ValueError):
         raise NotFound("Provider or tag not found")
@@ -234,7 +233,6 @@ def remove_tag(provider_email, tag_id):
             raise BadRequest("Invalid tag for provider")
 
         provider.tags.remove(tag)
-        provider.save()
 
     except (ObjectDoesNotExist, FieldError, IntegrityError, ValueError):
         raise NotFound("Provider or tag not found")
@@ -51,6 +51,7 @@ from ...services.helpers import InvalidFormatError, SchemaNotFound
 from ...services.phishing import PhishingService, PhishingServiceException
 from ...utils import networking
 from ...tasks import enqueue
+from ...utils.dates import to_timestamp
 
 DNS_ERROR = {"-2": "NXDOMAIN"}
 
@@ -170,7 +171,7 @@ def _format_item_response(item, now, queue):
     """
     # Add ip network, diff if resolved IP changed etc ...
     history = []
-    item["date"] = int(time.mktime(item["date"].timetuple()))
+    item["date"] = int(to_timestamp(item["date"]))
 
     if item.get("itemType") == "URL" and not item.get("fqdnResolved"):
         item["fqdnResolved"] = DNS_ERROR["-2"]
@@ -26,6 +26,7 @@ import json
 import operator
 import re
 from base64 import b64encode
+from hashlib import md5
 from Queue import Queue
 from threading import Thread
 from urllib import unquote
@@ -553,6 +554,7 @@ def get_attachment(report_id, attachment_id):
             "raw": b64encode(raw),
             "filetype": str(attachment.filetype),
             "filename": attachment.name.encode("utf-8"),
+            "etag": md5(attachment.filename.encode("utf-8")).hexdigest(),
         }
     except StorageServiceException:
         pass
@@ -640,7 +642,6 @@ def add_tag(report_id, body):
             raise BadRequest("Invalid tag for report")
 
         report.tags.add(tag)
-        report.save()
     except MultipleObjectsReturned:
         raise BadRequest("Please use tag id")
     except (KeyError, FieldError, IntegrityError, ObjectDoesNotExist, ValueError):
@@ -659,7 +660,6 @@ def remove_tag(report_id, tag_id):
             raise BadRequest("Invalid tag for report")
 
         report.tags.remove(tag)
-        report.save()
 
     except (ObjectDoesNotExist, FieldError, IntegrityError, ValueError):
         raise NotFound("Report or tag not found")
@@ -25,10 +25,10 @@
 import base64
 import json
 import operator
-import time
 
 from copy import deepcopy
 from datetime import datetime, timedelta
+from hashlib import md5
 from urllib import unquote
 
 from django.contrib.auth.models import User
@@ -75,6 +75,7 @@ from ...services.email import EmailService, EmailServiceException
 from ...services.search import SearchService, SearchServiceException
 from ...services.storage import StorageService, StorageServiceException
 from ...tasks import cancel, enqueue
+from ...utils.dates import to_timestamp
 
 
 def get_tickets(**kwargs):
@@ -328,7 +329,7 @@ def _get_ticket_comments(ticket):
         {
             "id": c.comment.id,
             "user": c.comment.user.username,
-            "date": time.mktime(c.comment.date.timetuple()),
+            "date": to_timestamp(c.comment.date),
             "comment": c.comment.comment,
         }
         for c in TicketComment.filter(ticket=ticket.id).order_by("-comment__date")
@@ -345,7 +346,7 @@ def _get_ticket_history(ticket):
         .order_by("-date")
     )
     return [
-        {"username": username, "date": time.mktime(date.timetuple()), "action": action}
+        {"username": username, "date": to_timestamp(date), "action": action}
         for username, date, action in history
     ]
 
@@ -506,7 +507,7 @@ def update(ticket, body, user, bulk=False):
     # If the user is a Beginner, he does not have the rights to modify these infos
     if user.abusepermission_set.filter(
         category=ticket.category, profile__name="Beginner"
-    ).count():
+    ).exists():
         body.pop("escalated", None)
         body.pop("moderation", None)
 
@@ -532,7 +533,7 @@ def update(ticket, body, user, bulk=False):
 
     try:
         Ticket.filter(pk=ticket.pk).update(**body)
-        ticket = Ticket.get(pk=ticket.pk)
+        ticket.refresh_from_db(fields=list(body))
         actions = _get_modifications(old, ticket, user)
 
         for action in actions:
@@ -710,7 +711,7 @@ def _update_duration(ticket, data, user):
         data[key.replace("Duration", "Start")] = datetime.now()
 
         Ticket.filter(pk=ticket.pk).update(**data)
-        ticket = Ticket.get(pk=ticket.pk)
+        ticket.refresh_from_db(fields=list(data))
 
         History.log_ticket_action(
             ticket=ticket,
@@ -1058,7 +1059,7 @@ def add_tag(ticket_id, body, user):
             raise BadRequest("Invalid tag for ticket")
 
         ticket.tags.add(tag)
-        ticket.save()
+        ticket.save(update_fields=["modificationDate"])
         History.log_ticket_action(
             ticket=ticket, action="add_tag", user=user, tag_name=tag.name
         )
@@ -1080,7 +1081,7 @@ def remove_tag(ticket_id, tag_id, user):
             raise BadRequest("Invalid tag for ticket")
 
         ticket.tags.remove(tag)
-        ticket.save()
+        ticket.save(update_fields=["modificationDate"])
         History.log_ticket_action(
             ticket=ticket, action="remove_tag", user=user, tag_name=tag.name
         )
@@ -1363,6 +1364,7 @@ def get_attachment(ticket_id, attachment_id):
             "raw": base64.b64encode(raw),
             "filetype": str(attachment.filetype),
             "filename": attachment.name.encode("utf-8"),
+            "etag": md5(attachment.filename.encode("utf-8")).hexdigest(),
         }
     except StorageServiceException:
         pass
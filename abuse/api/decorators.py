@@ -30,8 +30,6 @@ from werkzeug.exceptions import BadRequest, Forbidden
 
 from .controllers import misc as MiscController
 
-Schemas = {}
-
 
 def admin_required(func):
     """ Check if user is admin
@@ -39,7 +37,7 @@ def admin_required(func):
 
     @wraps(func)
     def check_admin(*args, **kwargs):
-        if not g.user.operator.role.codename == "admin":
+        if not g.get("role_codename") == "admin":
             raise Forbidden("Forbidden")
         return func(*args, **kwargs)
 
@@ -75,13 +73,13 @@ def validate_body(schema_desc):
     """
 
     def real_decorator(func):
+        schema = Schema(schema_desc, required=True)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 body = request.get_json()
-                if not Schemas.get(func.__name__):
-                    Schemas[func.__name__] = Schema(schema_desc, required=True)
-                Schemas[func.__name__](body)
+                schema(body)
             except (Invalid, MultipleInvalid):
                 msg = "Missing or invalid field(s) in body"
                 raise BadRequest(msg)
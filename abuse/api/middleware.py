@@ -1,5 +1,6 @@
 
 import json
+import logging
 import sys
 
 from datetime import datetime
@@ -90,7 +91,7 @@ def setup_middleware(api):
         try:
             data = jwt.decode(token, api.config["DJANGO"]["SECRET_KEY"])
             data = json.loads(crypto.CryptoHandler.decrypt(str(data["data"])))
-            user = User.objects.get(id=data["id"])
+            user = User.objects.select_related("operator__role").get(id=data["id"])
             g.user = user
 
             if user.last_login == datetime.fromtimestamp(0):
@@ -113,6 +114,7 @@ def setup_middleware(api):
 
         try:
             role_codename = g.user.operator.role.codename
+            g.role_codename = role_codename
             is_valid = RoleCache.is_valid(
                 role_codename, request.method, request.endpoint
             )
@@ -133,6 +135,9 @@ def setup_middleware(api):
         """
             Log all requests
         """
+        if not api.logger.isEnabledFor(logging.INFO):
+            return response
+
         response.direct_passthrough = False
         length = sys.getsizeof(response.get_data())
         diff = int((time() - g.start) * 1000)
@@ -166,12 +166,15 @@ def get_report_attachment(report=None, attachment=None):
     """
     resp = ReportsController.get_attachment(report, attachment)
     bytes_io = BytesIO(resp["raw"])
-    return send_file(
+    response = send_file(
         bytes_io,
         attachment_filename=resp["filename"],
         mimetype=resp["filetype"],
         as_attachment=True,
+        add_etags=False,
     )
+    response.set_etag(resp["etag"])
+    return response.make_conditional(request)
 
 
 @report_views.route("/<report>/tags", methods=["POST"])
@@ -351,12 +351,15 @@ def get_ticket_attachment(ticket=None, attachment=None):
     """
     resp = TicketsController.get_attachment(ticket, attachment)
     bytes_io = BytesIO(resp["raw"])
-    return send_file(
+    response = send_file(
         bytes_io,
         attachment_filename=resp["filename"],
         mimetype=resp["filetype"],
         as_attachment=True,
+        add_etags=False,
     )
+    response.set_etag(resp["etag"])
+    return response.make_conditional(request)
 
 
 @ticket_views.route("/<ticket>/star", methods=["POST", "DELETE"])
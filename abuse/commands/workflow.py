@@ -23,14 +23,21 @@
 """
 
 from datetime import datetime
-from time import time, mktime
 
 import click
 
 from flask.cli import with_appcontext
+from django.db import transaction
 from django.db.models import ObjectDoesNotExist
 
-from ..models import Ticket, History
+from ..models import History, Report, Ticket
+from ..models.helpers import AddSeconds
+
+# Latest status changes leading to auto unassignation, most recent first
+STATUS_SEQUENCE = ("WaitingAnswer", "Alarm", "WaitingAnswer")
+
+# Expired tickets are locked and updated by chunks of this size
+CHUNK_SIZE = 500
 
 
 @click.command("ticket-workflow", short_help="Runs Cerberus ticket workflow.")
@@ -45,36 +52,87 @@ def update_waiting():
     """
         Update waiting answer tickets
     """
-    now = int(time())
-    for ticket in Ticket.filter(status="WaitingAnswer"):
-        if ticket.snoozeStart and now > int(
-            mktime(ticket.snoozeStart.timetuple()) + ticket.snoozeDuration
-        ):
-            click.echo("[workflow] set status 'Alarm' for ticket %d" % ticket.id)
-            _check_auto_unassignation(ticket)
-            ticket.set_status("Alarm")
+    tickets = (
+        Ticket.filter(status="WaitingAnswer")
+        .prefetch_related("treatedBy__operator__role")
+        .only("status", "treatedBy")
+    )
+    tickets = _filter_expired(tickets, "snoozeStart", "snoozeDuration")
+
+    last_id = 0
+    while True:
+        with transaction.atomic():
+            chunk = _lock_chunk(tickets, last_id)
+            if not chunk:
+                break
+            for ticket in chunk:
+                click.echo("[workflow] set status 'Alarm' for ticket %d" % ticket.id)
+                _check_auto_unassignation(ticket)
+            _set_alarm(chunk)
+        last_id = chunk[-1].id
+
+
+def _lock_chunk(tickets, last_id):
+    """
+        Lock and fetch the next `CHUNK_SIZE` tickets after `last_id`,
+        rows already locked by a concurrent transaction are skipped
+    """
+    return list(
+        tickets.filter(id__gt=last_id)
+        .order_by("id")
+        .select_for_update(skip_locked=True)[:CHUNK_SIZE]
+    )
 
 
-def _check_auto_unassignation(ticket):
+def _set_alarm(tickets):
+    """
+        Bulk version of `abuse.models.Ticket.set_status` for expired
+        WaitingAnswer tickets
+    """
+    ids = [ticket.id for ticket in tickets]
+
+    Ticket.filter(id__in=ids).update(
+        status="Alarm",
+        previousStatus="WaitingAnswer",
+        action=None,
+        snoozeStart=None,
+        snoozeDuration=None,
+    )
+    Report.filter(ticket__in=ids).update(status="Attached")
+
+    for ticket in tickets:
+        ticket.previousStatus = ticket.status
+        ticket.status = "Alarm"
 
-    history = (
-        ticket.ticketHistory.filter(actionType="ChangeStatus")
-        .order_by("-date")
-        .values_list("ticketStatus", flat=True)[:3]
+    History.log_tickets_action(
+        tickets=tickets,
+        action="change_status",
+        previous_value="WaitingAnswer",
+        new_value="Alarm",
     )
 
-    status_sequence = ["WaitingAnswer", "Alarm", "WaitingAnswer"]
+
+def _filter_expired(tickets, start_field, duration_field):
+    """
+        Keep tickets whose `start_field` + `duration_field` seconds is over
+    """
+    expiration = AddSeconds(start_field, duration_field)
+    return tickets.annotate(expiration=expiration).filter(expiration__lt=datetime.now())
+
+
+def _check_auto_unassignation(ticket):
 
     try:
         models_config = ticket.treatedBy.operator.role.modelsAuthorizations
-        unassigned_on_multiple_alarm = models_config["ticket"][
-            "unassignedOnMultipleAlarm"
-        ]
-        if (
-            unassigned_on_multiple_alarm
-            and len(history) == 3
-            and all([status_sequence[i] == history[i] for i in xrange(3)])
-        ):
+        if not models_config["ticket"]["unassignedOnMultipleAlarm"]:
+            return
+
+        history = tuple(
+            ticket.ticketHistory.filter(actionType="ChangeStatus")
+            .order_by("-date")
+            .values_list("ticketStatus", flat=True)[: len(STATUS_SEQUENCE)]
+        )
+        if history == STATUS_SEQUENCE:
             History.log_ticket_action(
                 ticket=ticket,
                 action="change_treatedby",
@@ -82,7 +140,7 @@ def _check_auto_unassignation(ticket):
             )
             ticket.treatedBy = None
             ticket.alarm = True
-            ticket.save()
+            ticket.save(update_fields=["treatedBy", "alarm", "modificationDate"])
     except (AttributeError, KeyError, ObjectDoesNotExist, ValueError):
         pass
 
@@ -91,17 +149,30 @@ def update_paused():
     """
         Update paused tickets
     """
-    now = int(time())
-    for ticket in Ticket.filter(status="Paused"):
-        if now > int(mktime(ticket.pauseStart.timetuple()) + ticket.pauseDuration):
-            if (
-                ticket.previousStatus == "WaitingAnswer"
-                and ticket.snoozeDuration
-                and ticket.snoozeStart
-            ):
-                ticket.snoozeDuration += (datetime.now() - ticket.pauseStart).seconds
-
-            ticket.pauseStart = None
-            ticket.pauseDuration = None
-            ticket.save()
-            ticket.set_status(ticket.previousStatus)
+    tickets = Ticket.filter(status="Paused")
+    tickets = _filter_expired(tickets, "pauseStart", "pauseDuration")
+
+    last_id = 0
+    while True:
+        with transaction.atomic():
+            chunk = _lock_chunk(tickets, last_id)
+            if not chunk:
+                break
+            for ticket in chunk:
+                _unpause(ticket)
+        last_id = chunk[-1].id
+
+
+def _unpause(ticket):
+
+    if (
+        ticket.previousStatus == "WaitingAnswer"
+        and ticket.snoozeDuration
+        and ticket.snoozeStart
+    ):
+        ticket.snoozeDuration += (datetime.now() - ticket.pauseStart).seconds
+
+    ticket.pauseStart = None
+    ticket.pauseDuration = None
+    ticket.save()
+    ticket.set_status(ticket.previousStatus)
@@ -32,6 +32,9 @@ def setup_api(app):
 
     CORS(app)
 
+    # Avoid redirects on trailing slash mismatch
+    app.url_map.strict_slashes = False
+
     for view in views_to_register:
         prefix = "/api{}".format(view.url_prefix or "")
         app.register_blueprint(view, url_prefix=prefix)
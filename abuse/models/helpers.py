@@ -1,6 +1,10 @@
 
+from django.contrib.auth.models import User
 from django.db import models
 
+ROBOT_USERNAME = "abuse.robot"
+ROBOT_USER_ID = None
+
 
 # http://stackoverflow.com/questions/3459843/auto-truncating-fields-at-max-length-in-django-charfields
 class TruncatedCharField(models.CharField):
@@ -17,3 +21,38 @@ class TruncatedCharField(models.CharField):
         if value:
             return unicode_truncate(value, self.max_length)
         return value
+
+
+class AddSeconds(models.Func):
+    """
+        Shift a datetime expression by an integer expression of seconds
+    """
+
+    template = "(%(expressions)s)"
+    arg_joiner = " + INTERVAL '1 second' * "
+
+    def __init__(self, date, seconds, **extra):
+        extra.setdefault("output_field", models.DateTimeField())
+        super(AddSeconds, self).__init__(date, seconds, **extra)
+
+    def as_sqlite(self, compiler, connection):
+        return self.as_sql(
+            compiler,
+            connection,
+            template="datetime(%(expressions)s || ' seconds')",
+            arg_joiner=", '+' || ",
+        )
+
+
+def get_robot_user_id():
+    """
+        Returns the id of the `django.contrib.auth.models.User` used for
+        automated actions, looked up once and kept in `ROBOT_USER_ID`
+    """
+    global ROBOT_USER_ID
+
+    if ROBOT_USER_ID is None:
+        ROBOT_USER_ID = User.objects.values_list("id", flat=True).get(
+            username=ROBOT_USERNAME
+        )
+    return ROBOT_USER_ID
@@ -7,7 +7,7 @@ from django.db.models import DateTimeField, ForeignKey
 from django.contrib.auth.models import User
 
 from .base import CerberusModel
-from .helpers import TruncatedCharField
+from .helpers import TruncatedCharField, get_robot_user_id
 
 
 GENERIC_LOG_ACTION = (
@@ -78,21 +78,56 @@ class History(CerberusModel):
         """
             Log ticket modifications
         """
-        if not user:
-            user = User.objects.get(username="abuse.robot")
+        entry = cls._build_entry(ticket, action, user, **kwargs)
+        entry.save()
 
-        msg = get_log_message(ticket, action, user, **kwargs)
+        generates_kpi_infos(ticket, entry.action)
 
-        cls.create(
+    @classmethod
+    def log_tickets_action(cls, tickets=None, action=None, user=None, **kwargs):
+        """
+            Log the same modification on multiple tickets at once
+        """
+        cls._bulk_log(
+            [cls._build_entry(ticket, action, user, **kwargs) for ticket in tickets]
+        )
+
+    @classmethod
+    def log_ticket_actions(cls, ticket=None, action=None, user=None, params=None):
+        """
+            Log the same kind of modification several times on one ticket,
+            once for each kwargs dict in `params`
+        """
+        cls._bulk_log(
+            [
+                cls._build_entry(ticket, action, user, **kwargs)
+                for kwargs in params or []
+            ]
+        )
+
+    @classmethod
+    def _build_entry(cls, ticket, action, user=None, **kwargs):
+        """
+            Returns an unsaved `abuse.models.History` for given ticket action
+        """
+        return cls(
             date=datetime.now(),
             ticket=ticket,
-            user=user,
-            action=msg,
+            user_id=user.id if user else get_robot_user_id(),
+            action=get_log_message(ticket, action, user, **kwargs),
             actionType="".join(word.capitalize() for word in action.split("_")),
             ticketStatus=ticket.status,
         )
 
-        generates_kpi_infos(ticket, msg)
+    @classmethod
+    def _bulk_log(cls, entries):
+        """
+            Save `entries` in one query and generates their KPI infos
+        """
+        cls.objects.bulk_create(entries)
+
+        for entry in entries:
+            generates_kpi_infos(entry.ticket, entry.action)
 
     @classmethod
     def log_new_report(cls, report):
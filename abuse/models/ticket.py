@@ -19,8 +19,8 @@ from django.db.models import (
 from django.contrib.auth.models import User
 
 from .base import CerberusModel
-from .helpers import TruncatedCharField
-from ..tasks import cancel, enqueue, is_job_scheduled
+from .helpers import TruncatedCharField, get_robot_user_id
+from ..tasks import cancel_many, enqueue
 
 
 class NoIpaddrItems(Exception):
@@ -297,21 +297,33 @@ class Ticket(CerberusModel):
 
     def get_service_action_ipaddr(self):
 
-        ips = []
+        from ..utils.networking import get_ip_network
 
-        for report in self.reportTicket.all():
-            ips.extend(report.get_attached_ipaddr())
-
-        ips = list(set(ips))
+        ticket_items = (
+            self.reportTicket.all()
+            .values_list(
+                "reportItemRelatedReport__ip", "reportItemRelatedReport__fqdnResolved"
+            )
+            .distinct()
+        )
 
-        if not ips:
+        seen = set()
+        managed = set()
+        for ip in (ip for items in ticket_items for ip in items if ip):
+            if ip in seen:
+                continue
+            seen.add(ip)
+            if get_ip_network(ip) == "managed":
+                managed.add(ip)
+                if len(managed) > 1:
+                    raise MultipleIpaddrItems(
+                        "ticket {} has multiple ipaddr items".format(self.id)
+                    )
+
+        if not managed:
             raise NoIpaddrItems("ticket {} has no ipaddr items".format(self.id))
-        if len(ips) > 1:
-            raise MultipleIpaddrItems(
-                "ticket {} has multiple ipaddr items".format(self.id)
-            )
 
-        return ips[0]
+        return managed.pop()
 
     def verify_service_action_ipaddr(self, ip_addr):
 
@@ -335,11 +347,12 @@ class Ticket(CerberusModel):
         if ip_addr:
             query &= Q(ip=ip_addr)
 
-        for job in self.jobs.filter(query):
-            if is_job_scheduled(job.asynchronousJobId):
-                cancel(job.asynchronousJobId)
-                job.status = "cancelled by {}".format(reason)
-                job.save()
+        jobs = list(self.jobs.filter(query).values_list("id", "asynchronousJobId"))
+        cancelled = cancel_many([job_id for _, job_id in jobs])
+        ids = [pk for (pk, _), done in zip(jobs, cancelled) if done]
+
+        if ids:
+            self.jobs.filter(id__in=ids).update(status="cancelled by {}".format(reason))
 
     def get_action_remaining_time(self):
 
@@ -366,15 +379,13 @@ class Ticket(CerberusModel):
         from .misc import Comment
         from .history import History
 
-        if not user:
-            user = "abuse.robot"
-
         try:
-            author = User.objects.get(username=user)
+            author = User.objects.get(username=user) if user else None
         except (ValueError, TypeError, ObjectDoesNotExist):
             raise ValueError("invalid user {}".format(user))
 
-        comment = Comment.create(user=author, comment=comment)
+        author_id = author.id if author else get_robot_user_id()
+        comment = Comment.create(user_id=author_id, comment=comment)
 
         TicketComment.create(ticket=self, comment=comment)
         History.log_ticket_action(ticket=self, action="add_comment", user=author)
@@ -58,6 +58,9 @@ def load_templates():
 
     for template in files:
         infos = imp.load_source(template, os.path.join(template_base, template + ".py"))
+        for val in infos.TEMPLATE["regexp"].itervalues():
+            if "pattern" in val:
+                val["regex"] = re.compile(val["pattern"], re.I)
         templates[infos.TEMPLATE["email"]] = infos.TEMPLATE
 
     return templates
@@ -378,12 +381,13 @@ class Parser(object):
         try:
             for key, val in template["regexp"].iteritems():
                 if "pattern" in val:
+                    regex = val.get("regex")
+                    if not regex:
+                        regex = val["regex"] = re.compile(val["pattern"], re.I)
                     if "pretransform" in val:
-                        res = re.findall(
-                            val["pattern"], val["pretransform"](content), re.I
-                        )
+                        res = regex.findall(val["pretransform"](content))
                     else:
-                        res = re.findall(val["pattern"], content, re.I)
+                        res = regex.findall(content)
                     if res:
                         if "transform" in val:
                             res = self._guess_category(res[0])
@@ -51,7 +51,7 @@ TEMPLATE = {
         },
         "category": {
             "pretransform": pretransform,
-            "pattern": r"((.|\n|\r|\t)*)",
+            "pattern": r"(?s)(.*)",
             "transform": True,
         },
     },
@@ -27,6 +27,6 @@ TEMPLATE = {
     "email": "incident-report@bitninja.io",
     "regexp": {
         "ips": {"pattern": r"(?:Your\s*server\s*)" + Parser.ipv4_re},
-        "category": {"pattern": r"((.|\n|\r|\t)*)", "transform": True},
+        "category": {"pattern": r"(?s)(.*)", "transform": True},
     },
 }
@@ -28,6 +28,6 @@ TEMPLATE = {
     "regexp": {
         "ips": {"pattern": r"(?:check the machine behind the IP\s*)" + Parser.ipv4_re},
         "urls": {"pattern": r"(?:\|.*\|.*\|.*\|.*\|.*\|)" + Parser.url_re},
-        "category": {"pattern": r"((.|\n|\r|\t)*)", "transform": True},
+        "category": {"pattern": r"(?s)(.*)", "transform": True},
     },
 }
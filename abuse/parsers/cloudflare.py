@@ -31,6 +31,6 @@ TEMPLATE = {
             "pattern": r"The\s*actual\s*IP\s*address\s*hosting\s*(?:.*)\s*is\s*|The\s*actual\s*host\s*for\s*(?:.*)\s*is\s*"
             + Parser.ipv4_re
         },
-        "category": {"pattern": r"((.|\n|\r|\t)*)", "transform": True},
+        "category": {"pattern": r"(?s)(.*)", "transform": True},
     },
 }
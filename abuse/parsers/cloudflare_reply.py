@@ -32,6 +32,6 @@ TEMPLATE = {
             + Parser.domain_re
             + r")(?:\s*currently\s*resolves\s*to)"
         },
-        "category": {"pattern": r"((.|\n|\r|\t)*)", "transform": True},
+        "category": {"pattern": r"(?s)(.*)", "transform": True},
     },
 }
@@ -28,6 +28,6 @@ TEMPLATE = {
     "regexp": {
         "ips": {"pattern": r"(?:IP\s*:\s*)" + Parser.ipv4_re},
         "urls": {"pattern": r"(?:URL\s*:\s*)" + Parser.url_re},
-        "category": {"pattern": r"((.|\n|\r|\t)*)", "transform": True},
+        "category": {"pattern": r"(?s)(.*)", "transform": True},
     },
 }
@@ -30,6 +30,6 @@ TEMPLATE = {
         "ips": {"pattern": Parser.ipv4_re},
         "fqdn": {"pattern": Parser.fqdn_re},
         "urls": {"pattern": Parser.url_re},
-        "category": {"pattern": r"((.|\n|\r|\t)*)", "transform": True},
+        "category": {"pattern": r"(?s)(.*)", "transform": True},
     },
 }
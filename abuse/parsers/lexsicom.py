@@ -34,6 +34,6 @@ TEMPLATE = {
             "pattern": r"(?:contenus\s*manifestement\s*frauduleux\s*sur\s*|Site\s*concern.*\s*:\s*|at the following URL\s*:\s*)"
             + Parser.url_re
         },
-        "category": {"pattern": r"((.|\n|\r|\t)*)", "transform": True},
+        "category": {"pattern": r"(?s)(.*)", "transform": True},
     },
 }
@@ -27,6 +27,6 @@ TEMPLATE = {
     "email": "ddos-response@nfoservers.com",
     "regexp": {
         "ips": {"pattern": r"(?:running on IP address\s*)" + Parser.ipv4_re},
-        "category": {"pattern": r"((.|\n|\r|\t)*)", "transform": True},
+        "category": {"pattern": r"(?s)(.*)", "transform": True},
     },
 }
@@ -42,6 +42,6 @@ TEMPLATE = {
             "pattern": r"(?:The\s*following\s*URLs\s*are\s*some\s*components\s*of\s*this\s*phishing\s*attack\s*:\s*)"
             + Parser.url_re,
         },
-        "category": {"pattern": r"((.|\n|\r|\t)*)", "transform": True},
+        "category": {"pattern": r"(?s)(.*)", "transform": True},
     },
 }
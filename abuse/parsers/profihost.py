@@ -28,6 +28,6 @@ TEMPLATE = {
     "fallback": False,
     "regexp": {
         "ips": {"pattern": r"(?:Host\s*of\s*attacker\s*:\s*)" + Parser.ipv4_re},
-        "category": {"pattern": r"((.|\n|\r|\t)*)", "transform": True},
+        "category": {"pattern": r"(?s)(.*)", "transform": True},
     },
 }
@@ -38,7 +38,11 @@ class Actions(BaseActions):
 
         for instance in self._instances:
             if hasattr(instance, attr):
-                return getattr(instance, attr)
+                value = getattr(instance, attr)
+                if callable(value):
+                    # bound once, next lookups no longer reach __getattr__
+                    self.__dict__[attr] = value
+                return value
 
         raise AttributeError("'{}' is not a valid attribute".format(attr))
 
@@ -7,14 +7,15 @@
 import json
 
 from collections import OrderedDict
-from datetime import datetime, timedelta
-from time import mktime
+from datetime import timedelta
+from time import time
 
 from django.forms.models import model_to_dict
 
 from ...engine.actions import rule_action, BaseActions
 from ...engine.fields import FIELD_TEXT
-from ....models import History, Proof, Ticket, User, ReportItem
+from ....models import History, Proof, Ticket, ReportItem
+from ....models.helpers import get_robot_user_id
 from ....utils.cache import redis_lock, RedisHandler
 from ....tasks import enqueue_in, helpers
 
@@ -43,7 +44,7 @@ class DefaultCDNRequestActions(BaseActions):
         ticket, expiration = self._retrieve_from_cache(provider)
 
         # if already resolved, just attach report
-        if expiration and datetime.now() < expiration:
+        if expiration and time() < expiration:
             self.report.defendant = ticket.defendant
             self.report.service = ticket.service
             self.report.save()
@@ -73,7 +74,7 @@ class DefaultCDNRequestActions(BaseActions):
             entry = json.loads(entry, object_pairs_hook=OrderedDict)
             if entry["domain"] == self.domain_to_request:
                 ticket = Ticket.get(id=entry["request_ticket_id"])
-                expiration = datetime.fromtimestamp(entry["expiration"])
+                expiration = entry["expiration"]
                 break
 
         return ticket, expiration
@@ -85,7 +86,7 @@ class DefaultCDNRequestActions(BaseActions):
         """
         ticket = helpers.create_ticket(self.report, denied_by=None, attach_new=False)
 
-        ticket.treatedBy = User.objects.get(username="abuse.robot")
+        ticket.treatedBy_id = get_robot_user_id()
         ticket.save()
 
         self._send_email_request(provider, ticket)
@@ -134,8 +135,8 @@ class DefaultCDNRequestActions(BaseActions):
 
     def _get_expiration(self):
 
-        exp = datetime.now() + timedelta(days=self.cache_expirations_days)
-        return int(mktime(exp.timetuple()))
+        exp = timedelta(days=self.cache_expirations_days)
+        return int(time() + exp.total_seconds())
 
     def _rexecute_report_workflow(self, ticket):
 
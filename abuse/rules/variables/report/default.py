@@ -6,6 +6,8 @@
 
 
 from datetime import datetime, timedelta
+from functools import partial
+from multiprocessing.pool import ThreadPool
 
 from django.db.models import Q
 
@@ -27,6 +29,8 @@ from ....models import (
 from ....services import CRMService, PhishingService
 from ....services.phishing import PhishingServiceException
 
+PING_URLS_POOL_SIZE = 10
+
 
 def now():
     """
@@ -161,15 +165,9 @@ class DefaultReportVariables(BaseVariables):
         if self.report.defendant:
             country = self.report.defendant.details.country
 
-        results = []
-        for url in self.report.get_attached_urls():
-            try:
-                response = ping_url(url, try_screenshot, country)
-                results.append(response.score)
-            except PhishingServiceException:
-                results.append(0)
-
-        return all([score >= down_threshold for score in results])
+        responses = ping_urls(self.report.get_attached_urls(), try_screenshot, country)
+        scores = [resp.score if resp else 0 for resp in responses]
+        return all(score >= down_threshold for score in scores)
 
     @boolean_rule_variable()
     def all_items_phishing(self):
@@ -185,19 +183,8 @@ class DefaultReportVariables(BaseVariables):
         if self.report.defendant:
             country = self.report.defendant.details.country
 
-        results = set()
-        for url in self.report.get_attached_urls():
-            try:
-                response = ping_url(url, False, country)
-                results.add(response.is_phishing)
-            except PhishingServiceException:
-                results.add(False)
-
-        response = False
-        if results and all(results):
-            response = True
-
-        return response
+        responses = ping_urls(self.report.get_attached_urls(), False, country)
+        return bool(responses) and all(resp and resp.is_phishing for resp in responses)
 
     @boolean_rule_variable()
     def has_defendant(self):
@@ -405,3 +392,27 @@ class DefaultReportVariables(BaseVariables):
 def ping_url(url, try_screenshot=True, country="FR"):
 
     return PhishingService.ping_url(url, country=country, try_screenshot=try_screenshot)
+
+
+def ping_urls(urls, try_screenshot=True, country="FR"):
+    """
+        Ping `urls` concurrently (at most `PING_URLS_POOL_SIZE` at once),
+        `None` is returned for urls raising `PhishingServiceException`
+    """
+    urls = list(urls)
+    if not urls:
+        return []
+
+    pool = ThreadPool(min(len(urls), PING_URLS_POOL_SIZE))
+    try:
+        return pool.map(partial(_ping_url, try_screenshot, country), urls)
+    finally:
+        pool.terminate()
+
+
+def _ping_url(try_screenshot, country, url):
+
+    try:
+        return ping_url(url, try_screenshot, country)
+    except PhishingServiceException:
+        return None
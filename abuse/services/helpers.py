@@ -58,8 +58,16 @@ class WrongImplementationException(Exception):
         super(WrongImplementationException, self).__init__(message)
 
 
+IMPLEMENTATION_CLASSES = {}
+
+
 def get_implementation_class(base_name, impl_name):
 
+    try:
+        return IMPLEMENTATION_CLASSES[(base_name, impl_name)]
+    except KeyError:
+        pass
+
     module, cls = impl_name.rsplit(".", 1)
     module = import_module(module)
     impl_class = getattr(module, cls)
@@ -69,4 +77,5 @@ def get_implementation_class(base_name, impl_name):
             "class {} does not inherit {}".format(impl_name, base_name)
         )
 
+    IMPLEMENTATION_CLASSES[(base_name, impl_name)] = impl_class
     return impl_class
@@ -4,8 +4,6 @@ import logging
 from redis import Redis
 
 from rq import Queue, get_failed_queue, push_connection
-from rq.job import Job
-from rq.exceptions import NoSuchJobError
 from rq_scheduler import Scheduler
 from ..logs import TaskLoggerAdapter
 from ..utils.cache import RedisHandler
@@ -72,6 +70,14 @@ class Queues(object):
 
         cls.scheduler.cancel(job_id)
 
+    @classmethod
+    def cancel_many(cls, job_ids):
+
+        with cls.scheduler.connection.pipeline() as pipe:
+            for job_id in job_ids:
+                pipe.zrem(cls.scheduler.scheduled_jobs_key, job_id)
+            return [bool(removed) for removed in pipe.execute()]
+
 
 def is_job_scheduled(job_id):
 
@@ -82,25 +88,34 @@ def cancel_ticket_tasks(ticket_id):
 
     key = "{}:{}".format(ASYNC_TICKET_KEY, ticket_id)
 
-    for job_id in RedisHandler.ldump(key):
-        try:
-            job = Job.fetch(job_id)
-            logger.info(
-                'Cancelling Job "{}", kwargs {} ({})'.format(
-                    job.func_name, job.kwargs, job_id
-                )
-            )
-        except NoSuchJobError:
-            pass
-        cancel(job_id)
-
+    cancel_many(RedisHandler.ldump(key))
     RedisHandler.client.delete(key)
 
 
 def cancel(job_id):
 
     Queues.cancel(job_id)
-    logger.info("Cancelled Job {}".format(job_id))
+    logger.info("Cancelled Job %s", job_id)
+
+
+def cancel_many(job_ids):
+    """
+        Cancel given jobs in a single round trip
+
+        :param list job_ids: The Python-Rq jobs id
+        :rtype: list
+        :return: For each job, if it was still scheduled (False for empty ids)
+    """
+    scheduled = [job_id for job_id in job_ids if job_id]
+    if not scheduled:
+        return [False] * len(job_ids)
+
+    results = Queues.cancel_many(scheduled)
+    cancelled = set(job_id for job_id, done in zip(scheduled, results) if done)
+    if cancelled:
+        logger.info("Cancelled Jobs %s", ", ".join(sorted(cancelled)))
+
+    return [job_id in cancelled for job_id in job_ids]
 
 
 def enqueue(func_name, queue="default", *args, **kwargs):
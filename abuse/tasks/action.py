@@ -32,6 +32,7 @@ from . import enqueue, enqueue_in
 from . import helpers
 from ..logs import TaskLoggerAdapter
 from ..models import History, ServiceActionJob, Resolution, Ticket, User, ServiceAction
+from ..models.helpers import get_robot_user_id
 from ..services.action import ActionServiceException, ActionService
 
 logger = TaskLoggerAdapter(logging.getLogger("rq.worker"), dict())
@@ -71,13 +72,12 @@ def apply_action(
     """
     ticket = ticket_id
     if not isinstance(ticket_id, Ticket):
-        ticket = Ticket.get(id=ticket_id)
+        ticket = Ticket.objects.select_related("defendant__details").get(id=ticket_id)
 
     current_job = get_job_object()
 
+    # None means abuse.robot
     user = User.objects.filter(id=user_id).last()
-    if not user:
-        user = User.objects.get(username="abuse.robot")
 
     if not bypass_status and ticket.status in ("Closed", "Answered"):
         _cancel_by_status(ticket)
@@ -87,7 +87,7 @@ def apply_action(
     # Call action service
     try:
         result = ActionService.apply_action_on_service(
-            ticket_id, action_id, ip_addr, user.id
+            ticket_id, action_id, ip_addr, user.id if user else get_robot_user_id()
         )
         _update_job(
             current_job.id,
@@ -141,7 +141,7 @@ def _cancel_by_status(ticket):
         Action cancelled because of ticket status
     """
     current_job = get_job_object()
-    logger.error(unicode("Ticket %d is %s, Skipping..." % (ticket.id, ticket.status)))
+    logger.error(u"Ticket %d is %s, Skipping...", ticket.id, ticket.status)
     ServiceActionJob.filter(asynchronousJobId=current_job.id).update(
         status="cancelled", comment="ticket is %s" % (ticket.status)
     )
@@ -237,7 +237,7 @@ def _create_job(ticket, action, ip_addr, snooze_duration, seconds, params):
 def reminder(ticket_id=None, template="second_alert_with_action"):
 
     if not isinstance(ticket_id, Ticket):
-        ticket = Ticket.get(id=ticket_id)
+        ticket = Ticket.objects.select_related("defendant__details").get(id=ticket_id)
 
     if ticket.status != "WaitingAnswer":
         return
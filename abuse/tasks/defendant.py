@@ -34,9 +34,8 @@ def refresh_defendant_infos(defendant_id=None):
     fresh_infos = CRMService.get_customer_infos(defendant.customerId)
     fresh_infos.pop("customerId", None)
 
-    if DefendantRevision.filter(**fresh_infos).count():
-        revision = DefendantRevision.filter(**fresh_infos).last()
-    else:
+    revision = DefendantRevision.filter(**fresh_infos).last()
+    if not revision:
         revision = DefendantRevision.create(**fresh_infos)
         DefendantHistory.create(defendant=defendant, revision=revision)
 
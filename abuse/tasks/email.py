@@ -45,12 +45,16 @@ def send_ticket_email(
         attach_email_thread=attach_email_thread,
     )
 
-    for recipient in recipients:
-        EmailService.send_email(
-            ticket, recipient, subject, body, category, attachments=attachments
-        )
-        History.log_ticket_action(
-            ticket=ticket, action="send_email", user=user, email=recipient
+    sent = []
+    try:
+        for recipient in recipients:
+            EmailService.send_email(
+                ticket, recipient, subject, body, category, attachments=attachments
+            )
+            sent.append({"email": recipient})
+    finally:
+        History.log_ticket_actions(
+            ticket=ticket, action="send_email", user=user, params=sent
         )
 
 
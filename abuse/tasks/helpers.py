@@ -24,10 +24,12 @@
 
 import re
 
+from collections import defaultdict
+
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_email
 
-from ..models import History, Proof, Resolution, Ticket, User
+from ..models import History, Proof, ReportItem, Resolution, Ticket, User
 from ..parsers import Parser
 from ..services import EmailService, StorageService
 from ..tasks import enqueue
@@ -53,21 +55,25 @@ def send_email(
         ticket, template_codename, lang, acknowledged_report_id
     )
 
-    for email in emails:
-        try:
-            _email = email.strip()
-            validate_email(_email)
-        except (AttributeError, ValidationError):
-            continue
-
-        EmailService.send_email(
-            ticket,
-            _email,
-            prefetched_email.subject,
-            prefetched_email.body,
-            prefetched_email.category,
-        )
-        History.log_ticket_action(ticket=ticket, action="send_email", email=_email)
+    sent = []
+    try:
+        for email in emails:
+            try:
+                _email = email.strip()
+                validate_email(_email)
+            except (AttributeError, ValidationError):
+                continue
+
+            EmailService.send_email(
+                ticket,
+                _email,
+                prefetched_email.subject,
+                prefetched_email.body,
+                prefetched_email.category,
+            )
+            sent.append({"email": _email})
+    finally:
+        History.log_ticket_actions(ticket=ticket, action="send_email", params=sent)
 
     if inject_proof and temp_proofs:
         for proof in temp_proofs:
@@ -134,11 +140,21 @@ def _get_temp_proofs(ticket, only_urls=False):
     """
         Get report's ticket content
     """
+    reports = ticket.reportTicket.all()
+    if only_urls:
+        urls = defaultdict(list)
+        items = ReportItem.filter(report__ticket=ticket, itemType="URL").values_list(
+            "report_id", "rawItem"
+        )
+        for report_id, raw_item in items:
+            urls[report_id].append(raw_item)
+    else:
+        reports = reports.select_related("provider")
+
     temp_proofs = []
-    for report in ticket.reportTicket.all():
+    for report in reports:
         if only_urls:
-            items = report.reportItemRelatedReport.filter(itemType="URL")
-            content = "\n".join([item.rawItem for item in items])
+            content = "\n".join(urls[report.id])
         else:
             content = "From: %s\nDate: %s\nSubject: %s\n\n%s\n"
             content = content % (
@@ -150,7 +166,7 @@ def _get_temp_proofs(ticket, only_urls=False):
         # Remove potentially sensitive email addresses
         for email in re.findall(Parser.email_re, content):
             content = content.replace(email, "email-removed@provider.com")
-        temp_proofs.append(Proof.create(content=content, ticket=report.ticket))
+        temp_proofs.append(Proof.create(content=content, ticket=ticket))
     return temp_proofs
 
 
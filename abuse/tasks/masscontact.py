@@ -26,15 +26,15 @@ import hashlib
 import logging
 
 from collections import Counter
-from datetime import datetime
-from time import sleep
+from datetime import datetime, timedelta
 
 from django.core.validators import validate_ipv46_address
 from django.db import transaction
 from django.template import Context, engines
+from rq.job import JobStatus
 
 
-from . import helpers, Queues
+from . import enqueue_in, helpers, Queues
 from ..models import (
     Category,
     Defendant,
@@ -51,6 +51,8 @@ from ..utils import networking, pglocks
 
 django_template_engine = engines["django"]
 
+CHECK_RESULT_DELAY = timedelta(seconds=5)
+
 
 def mass_contact(
     ip_address=None,
@@ -87,9 +89,7 @@ def mass_contact(
 
     # Create report/ticket
     if services:
-        logging.debug(
-            unicode("creating report/ticket for ip address %s" % (ip_address))
-        )
+        logging.debug(u"creating report/ticket for ip address %s", ip_address)
         with pglocks.advisory_lock("cerberus_lock"):
             _create_contact_tickets(
                 services,
@@ -101,7 +101,7 @@ def mass_contact(
                 user,
             )
         return True
-    logging.debug(unicode("no service found for ip address %s" % (ip_address)))
+    logging.debug(u"no service found for ip address %s", ip_address)
     return False
 
 
@@ -177,30 +177,38 @@ def _send_mass_contact_email(ticket, email_subject, email_body):
     )
 
 
-def check_mass_contact_result(result_campaign_id=None, jobs=None):
+def check_mass_contact_result(result_campaign_id=None, jobs=None, results=None):
     """
         Check "mass-contact" campaign jobs's result
 
+        If some jobs are still pending, the check is rescheduled for the
+        remaining ones instead of holding the worker.
+
         :param int result_campaign_id: `abuse.models.MassContactResult` id
         :param list jobs: The list of associated Python-Rq jobs id
+        :param list results: Results of the already checked jobs
     """
-    campaign_result = MassContactResult.get(id=result_campaign_id)
-
-    result = []
-    for job_id in jobs:
+    result = results or []
+    for index, job_id in enumerate(jobs):
         job = Queues.default.fetch_job(job_id)
         if not job:
             continue
-        while job.status.lower() == "queued":
-            sleep(0.5)
+        if job.get_status() in (JobStatus.QUEUED, JobStatus.STARTED):
+            enqueue_in(
+                CHECK_RESULT_DELAY,
+                "masscontact.check_mass_contact_result",
+                result_campaign_id=result_campaign_id,
+                jobs=jobs[index:],
+                results=result,
+            )
+            return
         result.append(job.result)
 
+    campaign_result = MassContactResult.get(id=result_campaign_id)
     count = Counter(result)
     campaign_result.state = "Done"
     campaign_result.matchingCount = count[True]
     campaign_result.notMatchingCount = count[False]
     campaign_result.failedCount = count[None]
     campaign_result.save()
-    logging.info(
-        unicode("MassContact campaign {} finished".format(campaign_result.campaign.id))
-    )
+    logging.info(u"MassContact campaign %s finished", campaign_result.campaign_id)
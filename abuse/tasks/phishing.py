@@ -47,7 +47,7 @@ def close_because_all_down(report=None, denied_by=None):
         report.ticket = helpers.create_ticket(report, denied_by)
         report.save()
 
-    inject_proof = not bool(report.ticket.proof.count())
+    inject_proof = not report.ticket.proof.exists()
 
     # Send email to provider
     helpers.send_email(
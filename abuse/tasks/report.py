@@ -90,11 +90,11 @@ def create_from_email(email_content=None, filename=None, ack_lang="EN"):
     # Parse email content
     parser = Parser()
     abuse_report = parser.parse_from_email(email_content)
-    logger.info(unicode("New email from {}".format(abuse_report.provider)))
+    logger.info(u"New email from %s", abuse_report.provider)
 
     # Check if provider is not blacklisted
     if abuse_report.blacklisted:
-        logger.error(unicode("Provider %s is blacklisted" % (abuse_report.provider)))
+        logger.error(u"Provider %s is blacklisted", abuse_report.provider)
         return
 
     # Check if it's an answer to a ticket(s)
@@ -152,7 +152,7 @@ def create_from_email(email_content=None, filename=None, ack_lang="EN"):
         _report = Report.get(id=report.id)
         History.log_new_report(_report)
 
-    logger.info(unicode("All done successfully for email %s" % (filename)))
+    logger.info(u"All done successfully for email %s", filename)
 
 
 def _create_defendants_and_services(services):
@@ -253,7 +253,7 @@ def _create_with_services(abuse_report, filename, services, ack_lang="EN"):
 
 def _apply_business_rules(**kwargs):
 
-    if not BusinessRules.count():
+    if not BusinessRules.all().exists():
         return False
 
     report = kwargs.get("report")
@@ -279,7 +279,7 @@ def _apply_business_rules(**kwargs):
             )
             if report:
                 report.add_tag(rule.name)
-            logger.info(unicode("Workflow %s applied" % str(rule.name)))
+            logger.info(u"Workflow %s applied", rule.name)
             return True
 
     logger.info("No specific workflow applied")
@@ -325,13 +325,11 @@ def index_reports_to_searchservice(parsed_email=None, filename=None, report_ids=
         Index `abuse.models.Report` to SearchService
     """
     try:
-        logger.info(unicode("Pushing email %s document to SearchService" % (filename)))
+        logger.info(u"Pushing email %s document to SearchService", filename)
         SearchService.index_email(parsed_email, filename, report_ids)
     except SearchServiceException as ex:
         # Not fatal => don't stop current routine
-        logger.error(
-            unicode("Unable to index mail %s in SearchService -> %s" % (filename, ex))
-        )
+        logger.error(u"Unable to index mail %s in SearchService -> %s", filename, ex)
 
 
 def _add_items(report_id, items):
@@ -423,10 +421,10 @@ def _update_ticket_if_answer(ticket, category, recipient, abuse_report, filename
         :param str filename: The filename of the email
     """
     logger.info(
-        unicode(
-            "New %s answer from %s for ticket %s"
-            % (category, abuse_report.provider, ticket.id)
-        )
+        u"New %s answer from %s for ticket %s",
+        category,
+        abuse_report.provider,
+        ticket.id,
     )
 
     try:
@@ -463,15 +461,13 @@ def archive_if_timeout(report_id=None):
     report = Report.get(id=report_id)
 
     if report.status != "New":
-        logger.error(
-            unicode("Report %d not New, status : %s" % (report_id, report.status))
-        )
+        logger.error(u"Report %d not New, status : %s", report_id, report.status)
         return
 
     report.ticket = None
     report.status = "Archived"
     report.save()
-    logger.info(unicode("Report %d successfully archived" % (report_id)))
+    logger.info(u"Report %d successfully archived", report_id)
 
 
 @transaction.atomic
@@ -485,13 +481,12 @@ def validate_with_defendant(report_id=None):
     ticket = report.ticket
 
     if not ticket and all((report.defendant, report.category, report.service)):
-        msg = "Looking for opened ticket for (%s, %s, %s)"
-        msg = msg % (
+        logger.info(
+            u"Looking for opened ticket for (%s, %s, %s)",
             report.defendant.customerId,
             report.category.name,
             report.service.name,
         )
-        logger.info(unicode(msg))
         ticket = Ticket.search(report.defendant, report.category, report.service)
 
     # Checking specific processing workflow
@@ -503,7 +498,7 @@ def validate_with_defendant(report_id=None):
         rules_type="Report",
     )
 
-    logger.info(unicode("Report %d successfully processed" % (report_id)))
+    logger.info(u"Report %d successfully processed", report_id)
 
 
 @transaction.atomic
@@ -523,14 +518,12 @@ def validate_without_defendant(report_id=None, user_id=None):
 
     helpers.close_ticket(report.ticket, resolution_codename="invalid", user=user)
 
-    logger.info(
-        unicode("Ticket %d and report %d closed" % (report.ticket.id, report.id))
-    )
+    logger.info(u"Ticket %d and report %d closed", report.ticket.id, report.id)
 
 
 def _send_emails_invalid_report(report):
 
-    inject_proof = not bool(report.ticket.proof.count())
+    inject_proof = not report.ticket.proof.exists()
 
     helpers.send_email(
         report.ticket,
@@ -22,9 +22,8 @@
     Ticket async tasks
 """
 
-from datetime import timedelta
-
 from django.db.models import ObjectDoesNotExist
+from redis import WatchError
 
 from . import Queues, cancel_ticket_tasks
 from ..models import History, Report, Ticket, User, BusinessRules
@@ -52,18 +51,48 @@ def delay_jobs(ticket=None, delay=None, back=True):
         except (AttributeError, ObjectDoesNotExist, TypeError, ValueError):
             raise AssertionError("Ticket {} not found".format(ticket))
 
-    # a job is here a tuple (Job instance, datetime instance)
-    pending_jobs = Queues.scheduler.get_jobs(until=timedelta(days=7), with_times=True)
-
-    pending_jobs = {job[0].id: job for job in pending_jobs}
-
-    for job in ticket.jobs.all():
-        if pending_jobs.get(job.asynchronousJobId):
-            current_date = pending_jobs[job.asynchronousJobId][1]
-            new_date = current_date - delay if back else current_date + delay
-            Queues.scheduler.change_execution_time(
-                pending_jobs[job.asynchronousJobId][0], new_date
-            )
+    job_ids = [
+        job_id
+        for job_id in ticket.jobs.values_list("asynchronousJobId", flat=True)
+        if job_id
+    ]
+    if not job_ids:
+        return
+
+    key = Queues.scheduler.scheduled_jobs_key
+    offset = -delay.total_seconds() if back else delay.total_seconds()
+
+    with Queues.scheduler.connection.pipeline() as pipe:
+        while True:
+            try:
+                # Abort if a job is run, cancelled or rescheduled meanwhile
+                pipe.watch(key)
+                new_scores = _get_delayed_scores(key, job_ids, offset)
+                if not new_scores:
+                    return
+                pipe.multi()
+                pipe.zadd(key, **new_scores)
+                pipe.execute()
+                return
+            except WatchError:
+                continue
+
+
+def _get_delayed_scores(key, job_ids, offset):
+    """
+        Returns shifted scheduler scores (execution timestamps)
+        of still scheduled jobs
+    """
+    with Queues.scheduler.connection.pipeline(transaction=False) as pipe:
+        for job_id in job_ids:
+            pipe.zscore(key, job_id)
+        scores = pipe.execute()
+
+    return {
+        job_id: score + offset
+        for job_id, score in zip(job_ids, scores)
+        if score is not None
+    }
 
 
 def create_ticket_from_phishtocheck(report=None, user=None):
@@ -143,6 +143,8 @@ class ApiTestCase(CerberusTest):
         response = json.loads(response.get_data())
         self.assertEqual(1, response["report"][0]["count"])
         self.assertEqual("john.doe@example.com", response["report"][0]["email"])
+        self.assertEqual(1, response["ticket"][0]["count"])
+        self.assertEqual("john.doe.42", response["ticket"][0]["customerId"])
 
     def test_admin(self):
 
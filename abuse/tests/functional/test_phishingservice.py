@@ -22,7 +22,11 @@
     Unit tests for phishing service default implementation
 """
 
-from ...services.phishing import PhishingService
+from mock import patch
+
+from ...rules.variables.report.default import ping_urls
+from ...services.helpers import InvalidFormatError
+from ...services.phishing import PhishingService, PhishingServiceException, PingResponse
 from ...tests.setup import CerberusTest
 
 
@@ -49,3 +53,34 @@ class TestDefaultPhishingImpl(CerberusTest):
             "https://www.ovh.com/fr/news/logos/with-baseline/logo-ovh-avec-150DPI.png",
             screenshots[0]["location"],
         )
+
+    def test_ping_urls(self):
+        """
+            Test ping_urls, failing urls are None
+        """
+
+        def ping_url(url, **kwargs):
+            if "down" in url:
+                raise PhishingServiceException("down")
+            return PingResponse(0, "200", "OK", "OK", False)
+
+        urls = ["http://www.example.com/%d" % i for i in range(20)]
+        urls[3] = "http://www.example.com/down"
+
+        with patch.object(PhishingService, "ping_url", side_effect=ping_url):
+            responses = ping_urls(urls)
+
+        self.assertEqual(20, len(responses))
+        self.assertIsNone(responses[3])
+        self.assertEqual(0, responses[0].score)
+        self.assertEqual([], ping_urls([]))
+
+    def test_ping_urls_error(self):
+        """
+            Test ping_urls propagates unexpected errors
+        """
+        with patch.object(
+            PhishingService, "ping_url", side_effect=InvalidFormatError("invalid")
+        ):
+            with self.assertRaises(InvalidFormatError):
+                ping_urls(["http://www.example.com/1", "http://www.example.com/2"])
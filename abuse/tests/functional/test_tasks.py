@@ -24,15 +24,81 @@
 
 import os
 
-from mock import patch
-
-from ...models import Defendant, Report, DefendantHistory, Provider
+from datetime import datetime, timedelta
+
+from django.contrib.auth.models import User
+from mock import Mock, patch
+from redis import WatchError
+from rq.job import JobStatus
+
+from ...models import (
+    Defendant,
+    MassContact,
+    MassContactResult,
+    Report,
+    DefendantHistory,
+    Provider,
+    ServiceAction,
+    ServiceActionJob,
+    Ticket,
+)
 from ...services.email import EmailService
 from ...services.storage import StorageService
+from ...tasks import Queues
+from ...tasks.masscontact import CHECK_RESULT_DELAY, check_mass_contact_result
 from ...tasks.report import create_from_email
+from ...tasks.ticket import delay_jobs
 from ...tests.setup import CerberusTest
 
 
+class FakeSchedulerRedis(object):
+    """
+        Minimal in-memory scheduler zset supporting pipelines and WATCH
+    """
+
+    def __init__(self, scores):
+        self.scores = scores
+        self.version = 0
+        self.on_read = None
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline(object):
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+        self.watched = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.watched = None
+
+    def watch(self, key):
+        self.watched = self.redis.version
+
+    def multi(self):
+        pass
+
+    def zscore(self, key, job_id):
+        self.commands.append(lambda: self.redis.scores.get(job_id))
+
+    def zadd(self, key, **scores):
+        self.commands.append(lambda: self.redis.scores.update(scores))
+
+    def execute(self):
+        commands, self.commands = self.commands, []
+        if self.watched is not None and self.watched != self.redis.version:
+            raise WatchError()
+        results = [command() for command in commands]
+        if self.watched is None and self.redis.on_read:
+            self.redis.on_read()
+        return results
+
+
 class TestWorkers(CerberusTest):
     """
         Unit tests for workers functions
@@ -232,3 +298,101 @@ class TestWorkers(CerberusTest):
         create_from_email(email_content=content)
         cerberus_report = Report.last()
         self.assertEqual("ToValidate", cerberus_report.status)
+
+    def _create_ticket_with_jobs(self, *job_ids):
+
+        ticket = Ticket.create(
+            publicId="DELAY", category_id="Spam", creationDate=datetime.now()
+        )
+        action = ServiceAction.get(name="default_action")
+        for job_id in job_ids:
+            job = ServiceActionJob.create(
+                action=action, asynchronousJobId=job_id, creationDate=datetime.now()
+            )
+            ticket.jobs.add(job)
+        return ticket
+
+    def test_delay_jobs(self):
+        """
+            Scheduled jobs of the ticket are shifted, others are untouched
+        """
+        redis = FakeSchedulerRedis({"job1": 1000.0, "other": 1000.0})
+        ticket = self._create_ticket_with_jobs("job1", "job2", None)
+        scheduler = Mock(connection=redis, scheduled_jobs_key="scheduled")
+
+        with patch.object(Queues, "scheduler", scheduler):
+            delay_jobs(ticket=ticket, delay=timedelta(seconds=60), back=False)
+
+        self.assertEqual({"job1": 1060.0, "other": 1000.0}, redis.scores)
+
+    def test_delay_removed_job(self):
+        """
+            A job removed from the scheduler while delaying is not re-added
+        """
+        redis = FakeSchedulerRedis({"job1": 1000.0, "job2": 1000.0})
+        ticket = self._create_ticket_with_jobs("job1", "job2")
+        scheduler = Mock(connection=redis, scheduled_jobs_key="scheduled")
+
+        def run_job():
+            # job1 runs between the scores read and the update
+            redis.on_read = None
+            redis.scores.pop("job1")
+            redis.version += 1
+
+        redis.on_read = run_job
+
+        with patch.object(Queues, "scheduler", scheduler):
+            delay_jobs(ticket=ticket, delay=timedelta(seconds=60), back=True)
+
+        self.assertEqual({"job2": 940.0}, redis.scores)
+
+    @patch("abuse.tasks.masscontact.enqueue_in")
+    def test_check_mass_contact_result(self, mock_enqueue):
+        """
+            Pending jobs reschedule the check, results are counted once done
+        """
+        campaign = MassContact.create(
+            campaignName="test",
+            category_id="Spam",
+            user=User.objects.get(username="abuse.robot"),
+            ipsCount=4,
+        )
+        campaign_result = MassContactResult.create(campaign=campaign)
+
+        rq_jobs = {
+            "job1": Mock(result=True),
+            "job2": Mock(result=False),
+            "job3": Mock(result=None),
+            "job4": Mock(result=True),
+        }
+        for job in rq_jobs.values():
+            job.get_status.return_value = JobStatus.FINISHED
+        rq_jobs["job2"].get_status.return_value = JobStatus.QUEUED
+        rq_jobs["job3"].get_status.return_value = JobStatus.FAILED
+        queue = Mock()
+        queue.fetch_job.side_effect = rq_jobs.get
+        jobs = ["job1", "job2", "job3", "job4"]
+
+        with patch.object(Queues, "default", queue):
+            check_mass_contact_result(result_campaign_id=campaign_result.id, jobs=jobs)
+
+            mock_enqueue.assert_called_once_with(
+                CHECK_RESULT_DELAY,
+                "masscontact.check_mass_contact_result",
+                result_campaign_id=campaign_result.id,
+                jobs=jobs[1:],
+                results=[True],
+            )
+            self.assertEqual(
+                "Pending", MassContactResult.get(id=campaign_result.id).state
+            )
+
+            rq_jobs["job2"].get_status.return_value = JobStatus.FINISHED
+            check_mass_contact_result(**mock_enqueue.call_args[1])
+
+        self.assertEqual(1, mock_enqueue.call_count)
+        campaign_result = MassContactResult.get(id=campaign_result.id)
+        self.assertEqual("Done", campaign_result.state)
+        self.assertEqual(2, campaign_result.matchingCount)
+        self.assertEqual(1, campaign_result.notMatchingCount)
+        self.assertEqual(1, campaign_result.failedCount)
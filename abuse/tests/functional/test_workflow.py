@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016, OVH SAS
+#
+# This file is part of Cerberus-core.
+#
+# Cerberus-core is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+    Unit tests for ticket workflow command
+"""
+
+from datetime import datetime, timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models.query import QuerySet
+from mock import patch
+
+from ...commands import workflow
+from ...models import History, Provider, Report, Role, ServiceAction, Ticket
+from ...models.helpers import AddSeconds
+from ...tests.setup import CerberusTest
+
+
+class TestWorkflow(CerberusTest):
+    """
+        Unit tests for ticket workflow command
+    """
+
+    def _create_ticket(self, **kwargs):
+
+        return Ticket.create(
+            publicId="W%d" % Ticket.objects.count(),
+            category_id="Spam",
+            creationDate=datetime.now(),
+            **kwargs
+        )
+
+    def _create_report(self, ticket):
+
+        return Report.create(
+            provider=Provider.get(email="low@provider.com"),
+            category_id="Spam",
+            ticket=ticket,
+            status="New",
+            body="test",
+            receivedDate=datetime.now(),
+            filename="test",
+        )
+
+    def _history(self, ticket):
+
+        return list(
+            History.filter(ticket=ticket)
+            .order_by("id")
+            .values_list("action", "actionType", "ticketStatus", "user")
+        )
+
+    def _set_unassignation(self, enabled):
+
+        role = Role.get(codename="admin")
+        role.modelsAuthorizations = {"ticket": {"unassignedOnMultipleAlarm": enabled}}
+        role.save()
+
+    def _create_assigned_ticket(self, statuses):
+
+        user = User.objects.get(username="abuse.robot")
+        ticket = self._create_ticket(
+            status="WaitingAnswer",
+            treatedBy=user,
+            snoozeStart=datetime.now() - timedelta(hours=2),
+            snoozeDuration=3600,
+        )
+        for minutes, status in enumerate(statuses):
+            History.create(
+                ticket=ticket,
+                user=user,
+                date=datetime.now() - timedelta(minutes=10 - minutes),
+                action="change status",
+                actionType="ChangeStatus",
+                ticketStatus=status,
+            )
+        return ticket
+
+    def test_update_waiting(self):
+        """
+            Only expired WaitingAnswer tickets are set to Alarm
+        """
+        now = datetime.now()
+        expired = self._create_ticket(
+            status="WaitingAnswer",
+            snoozeStart=now - timedelta(hours=2),
+            snoozeDuration=3600,
+        )
+        pending = self._create_ticket(
+            status="WaitingAnswer",
+            snoozeStart=now - timedelta(minutes=30),
+            snoozeDuration=3600,
+        )
+
+        workflow.update_waiting()
+
+        self.assertEqual("Alarm", Ticket.get(id=expired.id).status)
+        pending = Ticket.get(id=pending.id)
+        self.assertEqual("WaitingAnswer", pending.status)
+        self.assertEqual(3600, pending.snoozeDuration)
+        self.assertEqual([], self._history(pending))
+
+    def test_update_waiting_matches_set_status(self):
+        """
+            Bulk Alarm update leaves tickets as `Ticket.set_status` does
+        """
+        action = ServiceAction.get(name="default_action")
+        tickets = []
+        for _ in range(2):
+            ticket = self._create_ticket(
+                status="WaitingAnswer",
+                action=action,
+                snoozeStart=datetime.now() - timedelta(hours=2),
+                snoozeDuration=3600,
+            )
+            self._create_report(ticket)
+            tickets.append(ticket)
+
+        expected, ticket = tickets
+        expected.set_status("Alarm")
+        workflow.update_waiting()
+
+        expected = Ticket.get(id=expected.id)
+        ticket = Ticket.get(id=ticket.id)
+        for field in (
+            "status",
+            "previousStatus",
+            "action",
+            "snoozeStart",
+            "snoozeDuration",
+        ):
+            self.assertEqual(getattr(expected, field), getattr(ticket, field))
+        self.assertEqual(
+            list(expected.reportTicket.values_list("status", flat=True)),
+            list(ticket.reportTicket.values_list("status", flat=True)),
+        )
+        self.assertEqual(self._history(expected), self._history(ticket))
+
+    def test_update_paused(self):
+        """
+            Only expired Paused tickets get back their previous status
+        """
+        now = datetime.now()
+        expired = self._create_ticket(
+            status="Paused",
+            previousStatus="WaitingAnswer",
+            snoozeStart=now - timedelta(minutes=5),
+            snoozeDuration=600,
+            pauseStart=now - timedelta(seconds=100),
+            pauseDuration=50,
+        )
+        pending = self._create_ticket(
+            status="Paused",
+            previousStatus="Open",
+            pauseStart=now - timedelta(seconds=10),
+            pauseDuration=50,
+        )
+
+        workflow.update_paused()
+
+        expired = Ticket.get(id=expired.id)
+        self.assertEqual("WaitingAnswer", expired.status)
+        self.assertEqual("Paused", expired.previousStatus)
+        self.assertIsNone(expired.pauseStart)
+        self.assertIsNone(expired.pauseDuration)
+        self.assertTrue(700 <= expired.snoozeDuration <= 705)
+
+        pending = Ticket.get(id=pending.id)
+        self.assertEqual("Paused", pending.status)
+        self.assertEqual(50, pending.pauseDuration)
+        self.assertEqual([], self._history(pending))
+
+    def test_auto_unassignation(self):
+        """
+            WaitingAnswer -> Alarm -> WaitingAnswer tickets are unassigned
+        """
+        self._set_unassignation(True)
+        ticket = self._create_assigned_ticket(
+            ("WaitingAnswer", "Alarm", "WaitingAnswer")
+        )
+
+        workflow.update_waiting()
+
+        ticket = Ticket.get(id=ticket.id)
+        self.assertEqual("Alarm", ticket.status)
+        self.assertIsNone(ticket.treatedBy)
+        self.assertTrue(ticket.alarm)
+        self.assertIn(
+            "change treatedBy from abuse.robot to nobody",
+            [entry[0] for entry in self._history(ticket)],
+        )
+
+    def test_no_auto_unassignation(self):
+        """
+            Other status sequences or roles keep the ticket assigned
+        """
+        self._set_unassignation(True)
+        first = self._create_assigned_ticket(("Open", "Alarm", "WaitingAnswer"))
+        workflow.update_waiting()
+
+        self._set_unassignation(False)
+        second = self._create_assigned_ticket(
+            ("WaitingAnswer", "Alarm", "WaitingAnswer")
+        )
+        workflow.update_waiting()
+
+        for ticket in (first, second):
+            ticket = Ticket.get(id=ticket.id)
+            self.assertEqual("Alarm", ticket.status)
+            self.assertEqual("abuse.robot", ticket.treatedBy.username)
+            self.assertFalse(ticket.alarm)
+
+    def test_add_seconds(self):
+        """
+            `AddSeconds` shifts a datetime by a column of seconds
+        """
+        start = datetime.now().replace(microsecond=0) - timedelta(days=1)
+        ticket = self._create_ticket(snoozeStart=start, snoozeDuration=90)
+
+        expiration = (
+            Ticket.filter(id=ticket.id)
+            .annotate(expiration=AddSeconds("snoozeStart", "snoozeDuration"))
+            .values_list("expiration", flat=True)
+            .get()
+        )
+        self.assertEqual(start + timedelta(seconds=90), expiration)
+
+    def test_add_seconds_default_sql(self):
+        """
+            Default (PostgreSQL) rendering of `AddSeconds`
+        """
+        query = Ticket.objects.annotate(
+            expiration=AddSeconds("snoozeStart", "snoozeDuration")
+        ).query
+        compiler = query.get_compiler(connection=connection)
+        sql, params = query.annotations["expiration"].as_sql(compiler, connection)
+
+        self.assertEqual(
+            '("abuse_ticket"."snoozeStart" + INTERVAL \'1 second\' * '
+            '"abuse_ticket"."snoozeDuration")',
+            sql,
+        )
+        self.assertEqual([], list(params))
+
+    @patch.object(workflow, "CHUNK_SIZE", 1)
+    def test_update_waiting_locks_chunks(self):
+        """
+            Expired tickets are locked (skipping locked rows) chunk by chunk
+        """
+        start = datetime.now() - timedelta(hours=2)
+        tickets = [
+            self._create_ticket(
+                status="WaitingAnswer", snoozeStart=start, snoozeDuration=3600
+            )
+            for _ in range(3)
+        ]
+
+        with patch.object(
+            QuerySet,
+            "select_for_update",
+            autospec=True,
+            side_effect=QuerySet.select_for_update,
+        ) as mock_lock:
+            workflow.update_waiting()
+
+        # one query per chunk, plus the empty one ending the loop
+        self.assertEqual(4, mock_lock.call_count)
+        for call in mock_lock.call_args_list:
+            self.assertEqual({"skip_locked": True}, call[1])
+
+        for ticket in tickets:
+            self.assertEqual("Alarm", Ticket.get(id=ticket.id).status)
+
+    @patch.object(workflow, "CHUNK_SIZE", 1)
+    def test_update_paused_uses_locked_rows(self):
+        """
+            Paused tickets are updated from the rows read under lock
+        """
+        start = datetime.now() - timedelta(hours=2)
+        tickets = [
+            self._create_ticket(
+                status="Paused",
+                previousStatus="Open",
+                pauseStart=start,
+                pauseDuration=60,
+            )
+            for _ in range(2)
+        ]
+        # Concurrent edit made after the tickets were first loaded
+        Ticket.filter(id=tickets[1].id).update(previousStatus="Alarm")
+
+        with patch.object(
+            QuerySet,
+            "select_for_update",
+            autospec=True,
+            side_effect=QuerySet.select_for_update,
+        ) as mock_lock:
+            workflow.update_paused()
+
+        self.assertEqual(3, mock_lock.call_count)
+        self.assertEqual("Open", Ticket.get(id=tickets[0].id).status)
+        self.assertEqual("Alarm", Ticket.get(id=tickets[1].id).status)
@@ -78,14 +78,17 @@ class CerberusTest(TestCase):
         ]
 
         cls.patch_api_cache_delete = [
-            "abuse.api.cache.Cache.instance.delete",
+            "abuse.api.cache.Cache.instance.delete_many",
             Mock(return_value=None),
         ]
 
     @classmethod
     def tearDownClass(cls):
 
+        from ..models import helpers
+
         call_command("flush", verbosity=0, interactive=False, out="/dev/null")
+        helpers.ROBOT_USER_ID = None
 
 
 def setup_db():
@@ -53,6 +53,15 @@ NO_FALLBACK_SPECIFIED_TEMPLATE = {
     },
 }
 
+DIRECT_TEMPLATE = {
+    "email": "direct@template.com",
+    "fallback": False,
+    "regexp": {
+        "ips": {"pattern": r"(?:I'm\s*hidden\s*)" + Parser.ipv4_re},
+        "category": {"value": "Spam"},
+    },
+}
+
 
 class TestParser(CerberusTest):
     """
@@ -71,6 +80,7 @@ class TestParser(CerberusTest):
         cls.parser.email_templates[
             FALLBACK_FALSE_TEMPLATE["email"]
         ] = FALLBACK_FALSE_TEMPLATE
+        cls.parser.email_templates[DIRECT_TEMPLATE["email"]] = DIRECT_TEMPLATE
 
         for root, dirs, files in os.walk(
             os.path.abspath(os.path.dirname(__file__)) + "/../samples/"
@@ -338,6 +348,15 @@ class TestParser(CerberusTest):
         parsed_email = self.parser.parse_from_email(sample)
         self.assertEqual(1, len(parsed_email.ips))
 
+    def test_directly_registered_template(self):
+
+        sample = self.samples["sample16"].replace(
+            "true@fallback.com", DIRECT_TEMPLATE["email"]
+        )
+        parsed_email = self.parser.parse_from_email(sample)
+        self.assertEqual(DIRECT_TEMPLATE["email"], parsed_email.applied_template)
+        self.assertEqual(["1.2.3.4"], parsed_email.ips)
+
     def test_no_fallback_specified(self):
 
         sample = self.samples["sample17"]
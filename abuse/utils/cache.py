@@ -73,6 +73,11 @@ class RedisHandler(object):
 
         cls.client.rpush(queue, data)
 
+    @classmethod
+    def setnx(cls, key, value, timeout):
+
+        return cls.client.set(key, value, nx=True, ex=timeout)
+
 
 def redis_lock(key):
     """
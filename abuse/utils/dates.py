@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016, OVH SAS
+#
+# This file is part of Cerberus-core.
+#
+# Cerberus-core is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+    Date utils for Cerberus
+"""
+
+from time import mktime
+
+
+def to_timestamp(date):
+    """
+        Convert a naive (local time) `datetime.datetime` or `datetime.date`
+        to a Unix timestamp
+
+        :param `datetime.datetime` date: The date to convert
+        :rtype: float
+        :return: The corresponding Unix timestamp
+    """
+    return mktime(date.timetuple())